@@ -10,14 +10,26 @@ Konfiguration via Umgebungsvariablen:
   OPENDTU_PASSWORD  - Passwort (Standard: "openDTU42")
 """
 
-import json
+import asyncio
+import hashlib
 import os
+import time
+from contextlib import asynccontextmanager
 from enum import IntEnum
-from typing import Optional
+from typing import Optional, Union
 
 import httpx
+import orjson
 from mcp.server.fastmcp import FastMCP
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from mcp.server.fastmcp.exceptions import ToolError
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationError,
+    field_validator,
+    model_validator,
+)
 
 # ---------------------------------------------------------------------------
 # Konfiguration
@@ -28,6 +40,14 @@ OPENDTU_USER = os.getenv("OPENDTU_USER", "admin")
 OPENDTU_PASSWORD = os.getenv("OPENDTU_PASSWORD", "openDTU42")
 
 REQUEST_TIMEOUT = 10.0  # Sekunden
+KEEPALIVE_EXPIRY = 30.0  # Sekunden, wie lange eine ungenutzte Verbindung offen bleibt
+
+# Cache-Dauer für lesende Endpunkte (OpenDTU aktualisiert die Daten ohnehin nur alle paar Sekunden)
+LIVEDATA_TTL = 3.0  # Sekunden
+LIMIT_STATUS_TTL = 2.0  # Sekunden
+
+# Maximale Anzahl gleichzeitiger Requests an OpenDTU (läuft auf einem ESP32)
+MAX_CONCURRENT_REQUESTS = 4
 
 # ---------------------------------------------------------------------------
 # Limit-Typen
@@ -40,6 +60,11 @@ class LimitType(IntEnum):
     RELATIVE_PERSISTENT = 257     # Prozent, dauerhaft (schreibt EEPROM!)
 
 
+_VALID_LIMIT_TYPES = frozenset(int(t) for t in LimitType)
+_RELATIVE_TYPES = frozenset({LimitType.RELATIVE_NON_PERSISTENT, LimitType.RELATIVE_PERSISTENT})
+_PERSISTENT_TYPES = frozenset({LimitType.ABSOLUTE_PERSISTENT, LimitType.RELATIVE_PERSISTENT})
+
+
 LIMIT_TYPE_LABELS = {
     LimitType.ABSOLUTE_NON_PERSISTENT: "Absolut, temporär (W)",
     LimitType.RELATIVE_NON_PERSISTENT: "Relativ, temporär (%)",
@@ -47,12 +72,115 @@ LIMIT_TYPE_LABELS = {
     LimitType.RELATIVE_PERSISTENT: "⚠️ Relativ, dauerhaft (%) – schreibt EEPROM!",
 }
 
+# ---------------------------------------------------------------------------
+# HTTP-Client
+# ---------------------------------------------------------------------------
+
+# Ein gemeinsamer Client für alle Requests, damit Verbindungen (Keep-Alive)
+# wiederverwendet werden, statt pro Tool-Aufruf neu aufgebaut zu werden.
+_client: Optional[httpx.AsyncClient] = None
+_client_lock = asyncio.Lock()
+# Begrenzt die Zahl gleichzeitig laufender Requests, auch bei parallelen Tool-Aufrufen
+_REQ_SEM = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Basis-URL und Auth ändern sich zur Laufzeit nicht und werden einmalig berechnet
+_BASE_URL: Optional[str] = None
+_AUTH: Optional[httpx.BasicAuth] = None
+
+
+def _init() -> None:
+    """Berechnet Basis-URL und Auth-Objekt aus der Konfiguration."""
+    global _BASE_URL, _AUTH
+    if _BASE_URL is not None:
+        return
+    if not OPENDTU_HOST:
+        raise ValueError(
+            "OPENDTU_HOST ist nicht gesetzt. Bitte Umgebungsvariable OPENDTU_HOST "
+            "mit IP oder Hostname der OpenDTU setzen (z.B. '192.168.1.100')."
+        )
+    host = OPENDTU_HOST.rstrip("/")
+    if not host.startswith(("http://", "https://")):
+        host = f"http://{host}"
+    _AUTH = httpx.BasicAuth(OPENDTU_USER, OPENDTU_PASSWORD)
+    _BASE_URL = host
+
+
+async def get_client() -> httpx.AsyncClient:
+    """Liefert den gemeinsamen AsyncClient und legt ihn beim ersten Aufruf an."""
+    global _client
+    if _client is None:
+        async with _client_lock:
+            if _client is None:
+                _init()
+                # HTTP/2 wird per ALPN ausgehandelt (nur bei https); spricht die
+                # OpenDTU nur HTTP/1.1, fällt httpx automatisch darauf zurück.
+                _client = httpx.AsyncClient(
+                    base_url=_BASE_URL,
+                    auth=_AUTH,
+                    timeout=REQUEST_TIMEOUT,
+                    http2=True,
+                    limits=httpx.Limits(
+                        max_connections=4,
+                        max_keepalive_connections=2,
+                        keepalive_expiry=KEEPALIVE_EXPIRY,
+                    ),
+                )
+    return _client
+
+
+async def _close_client() -> None:
+    global _client
+    if _client is not None:
+        # Erst austragen, damit neue Requests während aclose() einen frischen Client bekommen
+        client, _client = _client, None
+        await client.aclose()
+
+
+async def _warm_up() -> None:
+    """Baut die Verbindung zur OpenDTU vorab auf, damit der erste Tool-Aufruf sie wiederverwendet."""
+    try:
+        await _get("/api/system/status")
+    except Exception:
+        # Best effort: Fehler zeigen sich ohnehin beim ersten Tool-Aufruf
+        pass
+
+
+_warm_up_task: Optional[asyncio.Task] = None
+# Anzahl aktiver Sessions; der gemeinsame Client wird mit der letzten geschlossen
+_sessions = 0
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Wärmt die Verbindung beim Start der ersten Session vor.
+
+    FastMCP betritt die Lifespan pro Session. Vorab-Verbindungsaufbau und
+    gemeinsamer Client werden erst beendet, wenn die letzte aktive Session
+    endet – innerhalb der Event-Loop, zu der seine Verbindungen gehören.
+    """
+    global _warm_up_task, _sessions
+    if _sessions == 0:
+        _warm_up_task = asyncio.create_task(_warm_up())
+    _sessions += 1
+    try:
+        yield {}
+    finally:
+        _sessions -= 1
+        if _sessions == 0:
+            warm_up, _warm_up_task = _warm_up_task, None
+            if warm_up is not None:
+                warm_up.cancel()
+                await asyncio.gather(warm_up, return_exceptions=True)
+            await _close_client()
+
+
 # ---------------------------------------------------------------------------
 # MCP-Server
 # ---------------------------------------------------------------------------
 
 mcp = FastMCP(
     "opendtu_mcp",
+    lifespan=_lifespan,
     instructions=(
         "Dieser Server ermöglicht das Abfragen und Setzen von Wechselrichter-Limits "
         "über eine OpenDTU-Instanz. Für schreibende Operationen ist Authentifizierung "
@@ -65,23 +193,14 @@ mcp = FastMCP(
 # Hilfsfunktionen
 # ---------------------------------------------------------------------------
 
-def _base_url() -> str:
-    if not OPENDTU_HOST:
-        raise ValueError(
-            "OPENDTU_HOST ist nicht gesetzt. Bitte Umgebungsvariable OPENDTU_HOST "
-            "mit IP oder Hostname der OpenDTU setzen (z.B. '192.168.1.100')."
-        )
-    host = OPENDTU_HOST.rstrip("/")
-    if not host.startswith(("http://", "https://")):
-        host = f"http://{host}"
-    return host
-
-
-def _auth() -> httpx.BasicAuth:
-    return httpx.BasicAuth(OPENDTU_USER, OPENDTU_PASSWORD)
-
-
 def _handle_error(e: Exception) -> str:
+    # ValidationError ist ein ValueError, stammt hier aber aus einer OpenDTU-Antwort
+    if isinstance(e, ValidationError):
+        fields = ", ".join(".".join(map(str, err["loc"])) for err in e.errors())
+        return (
+            f"❌ Unerwartete Antwort von OpenDTU (ungültige Felder: {fields}). "
+            f"Bitte OpenDTU-Version prüfen."
+        )
     if isinstance(e, ValueError):
         return f"❌ Konfigurationsfehler: {e}"
     if isinstance(e, httpx.HTTPStatusError):
@@ -100,31 +219,94 @@ def _handle_error(e: Exception) -> str:
     return f"❌ Unerwarteter Fehler: {type(e).__name__}: {e}"
 
 
-async def _get(path: str, auth: bool = False) -> dict:
-    """Führt einen GET-Request gegen die OpenDTU-API aus."""
-    url = f"{_base_url()}{path}"
-    kwargs: dict = {"timeout": REQUEST_TIMEOUT}
-    if auth:
-        kwargs["auth"] = _auth()
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, **kwargs)
-        response.raise_for_status()
-        return response.json()
+# Pfad -> (Zeitstempel, ETag, Hash des Inhalts, JSON-Antwort)
+_cache: dict[str, tuple[float, Optional[str], bytes, dict]] = {}
+# Ein Lock pro Pfad, damit gleichzeitige Cache-Misses nur einen Request auslösen
+_cache_locks: dict[str, asyncio.Lock] = {}
+# Wird von _invalidate erhöht, damit ein laufender Abruf keine veralteten Daten zurückschreibt
+_cache_generations: dict[str, int] = {}
+
+
+def _cache_lookup(path: str, ttl: float) -> Optional[dict]:
+    entry = _cache.get(path)
+    if entry is not None and time.monotonic() - entry[0] < ttl:
+        return entry[3]
+    return None
+
+
+def _invalidate(path: str) -> None:
+    """Entfernt einen Eintrag aus dem GET-Cache (z.B. nach einer Änderung)."""
+    _cache.pop(path, None)
+    _cache_generations[path] = _cache_generations.get(path, 0) + 1
+
+
+async def _fetch(path: str) -> dict:
+    client = await get_client()
+    async with _REQ_SEM:
+        response = await client.get(path)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+
+async def _revalidate(path: str) -> dict:
+    """Holt einen Pfad neu und nutzt dabei den abgelaufenen Cache-Eintrag.
+
+    Ein vorhandenes ETag wird als If-None-Match mitgeschickt; bei 304 bleibt
+    die bisherige Antwort gültig. Sendet die OpenDTU kein ETag, wird der
+    Inhalt gehasht, um unveränderte Antworten nicht erneut zu parsen.
+    """
+    entry = _cache.get(path)
+    generation = _cache_generations.get(path, 0)
+    headers = {"If-None-Match": entry[1]} if entry is not None and entry[1] else None
+
+    client = await get_client()
+    async with _REQ_SEM:
+        response = await client.get(path, headers=headers)
+    if entry is not None and response.status_code == 304:
+        if _cache_generations.get(path, 0) == generation:
+            _cache[path] = (time.monotonic(), *entry[1:])
+        return entry[3]
+    response.raise_for_status()
+
+    content = response.content
+    digest = hashlib.blake2b(content, digest_size=16).digest()
+    if entry is not None and digest == entry[2]:
+        data = entry[3]
+    else:
+        data = orjson.loads(content)
+    if _cache_generations.get(path, 0) == generation:
+        _cache[path] = (time.monotonic(), response.headers.get("etag"), digest, data)
+    return data
+
+
+async def _get(path: str, ttl: float = 0) -> dict:
+    """Führt einen GET-Request gegen die OpenDTU-API aus.
+
+    Bei ttl > 0 wird die Antwort für ttl Sekunden zwischengespeichert.
+    """
+    if ttl <= 0:
+        return await _fetch(path)
+
+    cached = _cache_lookup(path, ttl)
+    if cached is not None:
+        return cached
+
+    lock = _cache_locks.setdefault(path, asyncio.Lock())
+    async with lock:
+        # Ein anderer Aufruf hat den Eintrag evtl. gerade erst geholt
+        cached = _cache_lookup(path, ttl)
+        if cached is not None:
+            return cached
+        return await _revalidate(path)
 
 
 async def _post_form(path: str, data: str) -> dict:
     """Führt einen POST-Request mit form-encoded Daten und Authentifizierung aus."""
-    url = f"{_base_url()}{path}"
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            url,
-            content=f"data={data}",
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            auth=_auth(),
-            timeout=REQUEST_TIMEOUT,
-        )
-        response.raise_for_status()
-        return response.json()
+    client = await get_client()
+    async with _REQ_SEM:
+        response = await client.post(path, data={"data": data})
+    response.raise_for_status()
+    return orjson.loads(response.content)
 
 
 # ---------------------------------------------------------------------------
@@ -132,7 +314,7 @@ async def _post_form(path: str, data: str) -> dict:
 # ---------------------------------------------------------------------------
 
 class GetLimitStatusInput(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     serial: Optional[str] = Field(
         default=None,
@@ -144,7 +326,7 @@ class GetLimitStatusInput(BaseModel):
 
 
 class SetLimitInput(BaseModel):
-    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, defer_build=True)
 
     serial: str = Field(
         ...,
@@ -175,9 +357,10 @@ class SetLimitInput(BaseModel):
     @field_validator("limit_type")
     @classmethod
     def validate_limit_type(cls, v: int) -> int:
-        valid = {int(t) for t in LimitType}
-        if v not in valid:
-            raise ValueError(f"Ungültiger limit_type '{v}'. Erlaubt: {sorted(valid)}")
+        if v not in _VALID_LIMIT_TYPES:
+            raise ValueError(
+                f"Ungültiger limit_type '{v}'. Erlaubt: {sorted(_VALID_LIMIT_TYPES)}"
+            )
         return v
 
     @field_validator("limit_value")
@@ -187,6 +370,263 @@ class SetLimitInput(BaseModel):
         return v
 
 
+class BulkSetLimitInput(BaseModel):
+    model_config = ConfigDict(extra="forbid", defer_build=True)
+
+    items: list[SetLimitInput] = Field(
+        ...,
+        description=(
+            "Liste der zu setzenden Limits, je Eintrag serial, limit_value und "
+            "optional limit_type (siehe `opendtu_set_limit`)."
+        ),
+        min_length=1,
+        max_length=32,
+    )
+
+    @model_validator(mode="after")
+    def validate_unique_serials(self) -> "BulkSetLimitInput":
+        # Parallele Requests an denselben Wechselrichter hätten ein zufälliges Endergebnis
+        seen: set[str] = set()
+        duplicates: set[str] = set()
+        for item in self.items:
+            if item.serial in seen:
+                duplicates.add(item.serial)
+            seen.add(item.serial)
+        if duplicates:
+            raise ValueError(
+                f"Seriennummern dürfen nur einmal vorkommen. Doppelt: {', '.join(sorted(duplicates))}"
+            )
+        return self
+
+
+# ---------------------------------------------------------------------------
+# Pydantic-Ausgabemodelle
+# ---------------------------------------------------------------------------
+
+# int bleibt int, damit Werte wie in der OpenDTU-Antwort ausgegeben werden (100 statt 100.0)
+Number = Union[int, float]
+
+
+class InverterInfo(BaseModel):
+    serial: str = "–"
+    name: str = "–"
+    reachable: bool = False
+    producing: bool = False
+    limit_relative: Optional[Number] = None
+    limit_absolute: float = -1  # -1 = unbekannt
+
+
+class InvertersOverview(BaseModel):
+    total_power: float = 0  # W
+    total_yield_day: float = 0  # Wh
+    total_yield_total: float = 0  # kWh
+    inverters: list[InverterInfo] = Field(default_factory=list)
+
+
+class LimitStatus(BaseModel):
+    serial: str
+    limit_relative: Number = 0
+    max_power: Number = 0
+    limit_set_status: str = "–"
+
+
+class LimitStatusList(BaseModel):
+    limits: list[LimitStatus] = Field(default_factory=list)
+
+
+# ---------------------------------------------------------------------------
+# Datenabfrage
+# ---------------------------------------------------------------------------
+
+class SerialNotFoundError(Exception):
+    """Die angefragte Seriennummer ist in OpenDTU nicht konfiguriert."""
+
+    def __init__(self, serial: str, available: list[str]):
+        self.serial = serial
+        self.available = available
+        super().__init__(
+            f"❌ Seriennummer `{serial}` nicht gefunden.\n"
+            f"Verfügbare Seriennummern: {', '.join(f'`{s}`' for s in available)}"
+        )
+
+
+async def _inverters_data() -> InvertersOverview:
+    """Holt die Livedaten und wandelt sie in ein InvertersOverview um."""
+    data = await _get("/api/livedata/status", ttl=LIVEDATA_TTL)
+    total = data.get("total", {})
+    return InvertersOverview(
+        total_power=total.get("Power", {}).get("v", 0),
+        total_yield_day=total.get("YieldDay", {}).get("v", 0),
+        total_yield_total=total.get("YieldTotal", {}).get("v", 0),
+        inverters=[InverterInfo.model_validate(inv) for inv in data.get("inverters", [])],
+    )
+
+
+async def _limit_status_data(serial: Optional[str] = None) -> LimitStatusList:
+    """Holt den Limit-Status und filtert optional auf eine Seriennummer.
+
+    Raises:
+        SerialNotFoundError: Wenn die Seriennummer nicht in OpenDTU konfiguriert ist.
+    """
+    data = await _get("/api/limit/status", ttl=LIMIT_STATUS_TTL)
+    if not data:
+        return LimitStatusList()
+    if serial:
+        if serial not in data:
+            raise SerialNotFoundError(serial, list(data.keys()))
+        return LimitStatusList(limits=[LimitStatus(serial=serial, **data[serial])])
+    return LimitStatusList(
+        limits=[LimitStatus(serial=s, **info) for s, info in data.items()]
+    )
+
+
+def _check_limit_range(params: SetLimitInput) -> Optional[str]:
+    """Prüft den Wertebereich relativer Limits, gibt bei Fehler eine Meldung zurück."""
+    if LimitType(params.limit_type) in _RELATIVE_TYPES and not (0 <= params.limit_value <= 100):
+        return (
+            f"❌ Bei relativem Limit muss der Wert zwischen 0 und 100 (%) liegen. "
+            f"Angegeben: {params.limit_value}"
+        )
+    return None
+
+
+def _encode_limit(params: SetLimitInput) -> str:
+    return orjson.dumps({
+        "serial": params.serial,
+        "limit_type": params.limit_type,
+        "limit_value": params.limit_value,
+    }).decode()
+
+
+# ---------------------------------------------------------------------------
+# Markdown-Formatierung
+# ---------------------------------------------------------------------------
+
+_STATUS_MAP = {"Ok": "✅ Ok", "Pending": "⏳ Ausstehend", "Failure": "❌ Fehler"}
+_BOOL_YES, _BOOL_NO = "✅ Ja", "❌ Nein"
+_YES_NO = (_BOOL_NO, _BOOL_YES)  # Index: False/True
+
+_TOTALS_FMT = (
+    "**Gesamtleistung:** {:.1f} W  "
+    "| **Ertrag heute:** {:.0f} Wh  "
+    "| **Gesamtertrag:** {:.3f} kWh"
+)
+
+_INVERTER_TABLE_HEADER = (
+    "",
+    "| Seriennummer | Name | Erreichbar | Produziert | Limit (%) | Limit (W) |",
+    "|---|---|---|---|---|---|",
+)
+_INVERTER_ROW = "| `{}` | {} | {} | {} | {} % | {} W |".format
+
+_LIMIT_TABLE_HEADER = (
+    "## Limit-Status",
+    "",
+    "| Seriennummer | Limit (%) | Max. Leistung (W) | Aktuelles Limit (W) | Status |",
+    "|---|---|---|---|---|",
+)
+_LIMIT_ROW = "| `{}` | {} % | {} W | {} W | {} |".format
+
+_PERSISTENT_WARNING = (
+    "\n\n⚠️ **Warnung:** Du hast ein *dauerhaftes* Limit gesetzt, das den "
+    "EEPROM des Wechselrichters beschreibt. Häufige Änderungen verkürzen dessen "
+    "Lebensdauer. Bevorzuge temporäre Limits (limit_type 0 oder 1)."
+)
+
+_BULK_TABLE_HEADER = (
+    "## Limits setzen",
+    "",
+    "| Seriennummer | Neues Limit | Typ | Ergebnis |",
+    "|---|---|---|---|",
+)
+_BULK_ROW = "| `{}` | {} {} | {} | {} |".format
+
+_FULL_STATUS_TABLE_HEADER = (
+    "",
+    "| Seriennummer | Name | Erreichbar | Produziert | Limit (%) | Limit (W) "
+    "| Max. Leistung (W) | Status |",
+    "|---|---|---|---|---|---|---|---|",
+)
+_FULL_STATUS_ROW = "| `{}` | {} | {} | {} | {} % | {} W | {} W | {} |".format
+
+
+def _format_totals(overview: InvertersOverview) -> str:
+    return _TOTALS_FMT.format(
+        overview.total_power, overview.total_yield_day, overview.total_yield_total
+    )
+
+
+def _format_inverter_row(inv: InverterInfo) -> str:
+    return _INVERTER_ROW(
+        inv.serial,
+        inv.name,
+        _YES_NO[inv.reachable],
+        _YES_NO[inv.producing],
+        inv.limit_relative if inv.limit_relative is not None else "–",
+        f"{inv.limit_absolute:.0f}" if inv.limit_absolute >= 0 else "–",
+    )
+
+
+def _format_limit_row(info: LimitStatus) -> str:
+    current_w = round(info.limit_relative / 100 * info.max_power, 1) if info.max_power else "–"
+    status = _STATUS_MAP.get(info.limit_set_status, info.limit_set_status)
+    return _LIMIT_ROW(
+        info.serial, info.limit_relative, info.max_power, current_w, status
+    )
+
+
+def _format_full_status_row(inv: InverterInfo, info: Optional[LimitStatus]) -> str:
+    if info is not None:
+        max_power = info.max_power
+        status = _STATUS_MAP.get(info.limit_set_status, info.limit_set_status)
+    else:
+        max_power = status = "–"
+    return _FULL_STATUS_ROW(
+        inv.serial,
+        inv.name,
+        _YES_NO[inv.reachable],
+        _YES_NO[inv.producing],
+        inv.limit_relative if inv.limit_relative is not None else "–",
+        f"{inv.limit_absolute:.0f}" if inv.limit_absolute >= 0 else "–",
+        max_power,
+        status,
+    )
+
+
+def _inverters_markdown(overview: InvertersOverview) -> str:
+    if not overview.inverters:
+        return "ℹ️ Keine Wechselrichter in OpenDTU konfiguriert."
+    rows = [_format_inverter_row(inv) for inv in overview.inverters]
+    return "\n".join((
+        "## Wechselrichter-Übersicht",
+        "",
+        _format_totals(overview),
+        *_INVERTER_TABLE_HEADER,
+        *rows,
+    ))
+
+
+def _limit_status_markdown(status: LimitStatusList) -> str:
+    if not status.limits:
+        return "ℹ️ Keine Wechselrichter gefunden."
+    rows = [_format_limit_row(info) for info in status.limits]
+    return "\n".join((*_LIMIT_TABLE_HEADER, *rows))
+
+
+def _full_status_markdown(overview: InvertersOverview, status: LimitStatusList) -> str:
+    if not overview.inverters:
+        return "ℹ️ Keine Wechselrichter in OpenDTU konfiguriert."
+    by_serial = {info.serial: info for info in status.limits}
+    rows = [_format_full_status_row(inv, by_serial.get(inv.serial)) for inv in overview.inverters]
+    return "\n".join((
+        "## Wechselrichter-Status",
+        "",
+        _format_totals(overview),
+        *_FULL_STATUS_TABLE_HEADER,
+        *rows,
+    ))
+
+
 # ---------------------------------------------------------------------------
 # Tools
 # ---------------------------------------------------------------------------
@@ -218,41 +658,34 @@ async def opendtu_get_inverters() -> str:
             - limit_absolute (float): Aktuelles Limit in Watt (-1 = unbekannt)
     """
     try:
-        data = await _get("/api/livedata/status")
+        overview = await _inverters_data()
     except Exception as e:
         return _handle_error(e)
+    return _inverters_markdown(overview)
 
-    inverters = data.get("inverters", [])
-    if not inverters:
-        return "ℹ️ Keine Wechselrichter in OpenDTU konfiguriert."
-
-    total = data.get("total", {})
-    total_power = total.get("Power", {}).get("v", 0)
-    total_yield_day = total.get("YieldDay", {}).get("v", 0)
-    total_yield_total = total.get("YieldTotal", {}).get("v", 0)
-
-    lines = [
-        "## Wechselrichter-Übersicht",
-        "",
-        f"**Gesamtleistung:** {total_power:.1f} W  "
-        f"| **Ertrag heute:** {total_yield_day:.0f} Wh  "
-        f"| **Gesamtertrag:** {total_yield_total:.3f} kWh",
-        "",
-        "| Seriennummer | Name | Erreichbar | Produziert | Limit (%) | Limit (W) |",
-        "|---|---|---|---|---|---|",
-    ]
 
-    for inv in inverters:
-        serial = inv.get("serial", "–")
-        name = inv.get("name", "–")
-        reachable = "✅ Ja" if inv.get("reachable") else "❌ Nein"
-        producing = "✅ Ja" if inv.get("producing") else "❌ Nein"
-        limit_rel = inv.get("limit_relative", "–")
-        limit_abs = inv.get("limit_absolute", -1)
-        limit_abs_str = f"{limit_abs:.0f}" if limit_abs >= 0 else "–"
-        lines.append(f"| `{serial}` | {name} | {reachable} | {producing} | {limit_rel} % | {limit_abs_str} W |")
+@mcp.tool(
+    name="opendtu_get_inverters_data",
+    annotations={
+        "title": "Wechselrichter auflisten (strukturiert)",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def opendtu_get_inverters_data() -> InvertersOverview:
+    """Liefert die Daten von `opendtu_get_inverters` als strukturiertes Objekt.
 
-    return "\n".join(lines)
+    Returns:
+        InvertersOverview: Gesamtleistung, Tages- und Gesamtertrag sowie eine
+            Liste aller Wechselrichter (serial, name, reachable, producing,
+            limit_relative, limit_absolute).
+    """
+    try:
+        return await _inverters_data()
+    except Exception as e:
+        raise ToolError(_handle_error(e)) from e
 
 
 @mcp.tool(
@@ -283,45 +716,78 @@ async def opendtu_get_limit_status(params: GetLimitStatusInput) -> str:
             - current_limit_w (float): Berechnetes aktuelles Limit in Watt
             - limit_set_status (str): Status: "Ok", "Pending", "Failure"
     """
+    target = params.serial.strip() if params.serial else None
     try:
-        data = await _get("/api/limit/status")
+        status = await _limit_status_data(target)
+    except SerialNotFoundError as e:
+        return str(e)
     except Exception as e:
         return _handle_error(e)
+    return _limit_status_markdown(status)
 
-    if not data:
-        return "ℹ️ Keine Wechselrichter gefunden."
 
-    # Optionaler Filter nach Seriennummer
+@mcp.tool(
+    name="opendtu_get_limit_status_data",
+    annotations={
+        "title": "Limit-Status abfragen (strukturiert)",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def opendtu_get_limit_status_data(params: GetLimitStatusInput) -> LimitStatusList:
+    """Liefert die Daten von `opendtu_get_limit_status` als strukturiertes Objekt.
+
+    Args:
+        params (GetLimitStatusInput):
+            - serial (Optional[str]): Seriennummer für Filterung. Wenn leer → alle.
+
+    Returns:
+        LimitStatusList: Liste mit serial, limit_relative, max_power und
+            limit_set_status je Wechselrichter.
+    """
     target = params.serial.strip() if params.serial else None
-    if target and target not in data:
-        available = ", ".join(f"`{s}`" for s in data.keys())
-        return (
-            f"❌ Seriennummer `{target}` nicht gefunden.\n"
-            f"Verfügbare Seriennummern: {available}"
-        )
+    try:
+        return await _limit_status_data(target)
+    except SerialNotFoundError as e:
+        raise ToolError(str(e)) from e
+    except Exception as e:
+        raise ToolError(_handle_error(e)) from e
 
-    items = {target: data[target]} if target else data
 
-    lines = [
-        "## Limit-Status",
-        "",
-        "| Seriennummer | Limit (%) | Max. Leistung (W) | Aktuelles Limit (W) | Status |",
-        "|---|---|---|---|---|",
-    ]
-
-    for serial, info in items.items():
-        limit_rel = info.get("limit_relative", 0)
-        max_power = info.get("max_power", 0)
-        current_w = round(limit_rel / 100 * max_power, 1) if max_power else "–"
-        status_raw = info.get("limit_set_status", "–")
-        status = {"Ok": "✅ Ok", "Pending": "⏳ Ausstehend", "Failure": "❌ Fehler"}.get(
-            status_raw, status_raw
-        )
-        lines.append(
-            f"| `{serial}` | {limit_rel} % | {max_power} W | {current_w} W | {status} |"
-        )
+@mcp.tool(
+    name="opendtu_get_full_status",
+    annotations={
+        "title": "Wechselrichter inkl. Limit-Status anzeigen",
+        "readOnlyHint": True,
+        "destructiveHint": False,
+        "idempotentHint": True,
+        "openWorldHint": False,
+    },
+)
+async def opendtu_get_full_status() -> str:
+    """Zeigt Livedaten und Limit-Status aller Wechselrichter in einer Tabelle.
 
-    return "\n".join(lines)
+    Kombiniert `opendtu_get_inverters` und `opendtu_get_limit_status`; beide
+    Endpunkte werden parallel abgefragt.
+
+    Returns:
+        str: Markdown-Tabelle mit:
+            - serial (str): Seriennummer
+            - name (str): Name
+            - reachable (bool): Aktuell erreichbar
+            - producing (bool): Produziert gerade Strom
+            - limit_relative (float): Aktuelles Limit in Prozent
+            - limit_absolute (float): Aktuelles Limit in Watt (-1 = unbekannt)
+            - max_power (float): Maximale Nennleistung in Watt
+            - limit_set_status (str): Status: "Ok", "Pending", "Failure"
+    """
+    try:
+        overview, status = await asyncio.gather(_inverters_data(), _limit_status_data())
+    except Exception as e:
+        return _handle_error(e)
+    return _full_status_markdown(overview, status)
 
 
 @mcp.tool(
@@ -354,27 +820,14 @@ async def opendtu_set_limit(params: SetLimitInput) -> str:
     lt = LimitType(params.limit_type)
 
     # Wertebereich-Prüfung für relative Limits
-    if lt in (LimitType.RELATIVE_NON_PERSISTENT, LimitType.RELATIVE_PERSISTENT):
-        if not (0 <= params.limit_value <= 100):
-            return (
-                f"❌ Bei relativem Limit muss der Wert zwischen 0 und 100 (%) liegen. "
-                f"Angegeben: {params.limit_value}"
-            )
+    range_error = _check_limit_range(params)
+    if range_error:
+        return range_error
 
     # Warnung bei persistentem Limit
-    persistent_warning = ""
-    if lt in (LimitType.ABSOLUTE_PERSISTENT, LimitType.RELATIVE_PERSISTENT):
-        persistent_warning = (
-            "\n\n⚠️ **Warnung:** Du hast ein *dauerhaftes* Limit gesetzt, das den "
-            "EEPROM des Wechselrichters beschreibt. Häufige Änderungen verkürzen dessen "
-            "Lebensdauer. Bevorzuge temporäre Limits (limit_type 0 oder 1)."
-        )
+    persistent_warning = _PERSISTENT_WARNING if lt in _PERSISTENT_TYPES else ""
 
-    payload = json.dumps({
-        "serial": params.serial,
-        "limit_type": params.limit_type,
-        "limit_value": params.limit_value,
-    })
+    payload = _encode_limit(params)
 
     try:
         result = await _post_form("/api/limit/config", payload)
@@ -385,7 +838,9 @@ async def opendtu_set_limit(params: SetLimitInput) -> str:
     message = result.get("message", "")
 
     if result_type == "success":
-        unit = "%" if lt in (LimitType.RELATIVE_NON_PERSISTENT, LimitType.RELATIVE_PERSISTENT) else "W"
+        # Damit der nächste Status-Abruf die ausstehende Änderung zeigt
+        _invalidate("/api/limit/status")
+        unit = "%" if lt in _RELATIVE_TYPES else "W"
         limit_label = LIMIT_TYPE_LABELS[lt]
         response = (
             f"✅ Limit erfolgreich gesetzt!\n\n"
@@ -407,6 +862,73 @@ async def opendtu_set_limit(params: SetLimitInput) -> str:
     )
 
 
+@mcp.tool(
+    name="opendtu_set_limits_bulk",
+    annotations={
+        "title": "Limits mehrerer Wechselrichter setzen",
+        "readOnlyHint": False,
+        "destructiveHint": False,
+        "idempotentHint": False,
+        "openWorldHint": False,
+    },
+)
+async def opendtu_set_limits_bulk(params: BulkSetLimitInput) -> str:
+    """Setzt die Leistungslimits mehrerer Wechselrichter in einem Aufruf.
+
+    Die Requests an OpenDTU laufen parallel (höchstens MAX_CONCURRENT_REQUESTS gleichzeitig).
+    Ungültige Einträge werden übersprungen, ohne die übrigen zu beeinflussen.
+
+    ⚠️ WICHTIG: Wie bei `opendtu_set_limit` bevorzugt nicht-persistente Limits
+    (limit_type 0 oder 1) verwenden.
+
+    Args:
+        params (BulkSetLimitInput):
+            - items (list[SetLimitInput]): Je Eintrag serial, limit_value, limit_type
+
+    Returns:
+        str: Markdown-Tabelle mit dem Ergebnis je Wechselrichter.
+    """
+    range_errors = [_check_limit_range(item) for item in params.items]
+    valid = [item for item, err in zip(params.items, range_errors) if err is None]
+    results = iter(await asyncio.gather(
+        *(_post_form("/api/limit/config", _encode_limit(item)) for item in valid),
+        return_exceptions=True,
+    ))
+
+    lines = list(_BULK_TABLE_HEADER)
+    any_success = any_persistent = False
+    for item, range_error in zip(params.items, range_errors):
+        lt = LimitType(item.limit_type)
+        if range_error:
+            outcome = "❌ Wert muss zwischen 0 und 100 (%) liegen"
+        else:
+            result = next(results)
+            if isinstance(result, BaseException):
+                # Abbruch (CancelledError) nicht als Einzelfehler verschlucken
+                if not isinstance(result, Exception):
+                    raise result
+                outcome = _handle_error(result)
+            elif result.get("type", "") == "success":
+                outcome = "✅ Gesetzt"
+                any_success = True
+                any_persistent = any_persistent or lt in _PERSISTENT_TYPES
+            else:
+                outcome = f"⚠️ {result.get('type', '')} – {result.get('message', '')}"
+        unit = "%" if lt in _RELATIVE_TYPES else "W"
+        lines.append(_BULK_ROW(
+            item.serial, item.limit_value, unit, LIMIT_TYPE_LABELS[lt], outcome
+        ))
+
+    if any_success:
+        _invalidate("/api/limit/status")
+        lines.append("")
+        lines.append(
+            "⏳ Die Limits werden an die Wechselrichter übermittelt. "
+            "Mit `opendtu_get_limit_status` prüfen."
+        )
+    return "\n".join(lines) + (_PERSISTENT_WARNING if any_persistent else "")
+
+
 # ---------------------------------------------------------------------------
 # Einstiegspunkt
 # ---------------------------------------------------------------------------
@@ -0,0 +1,148 @@
+import asyncio
+from urllib.parse import parse_qs
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+
+import server
+
+LIMIT_STATUS = {
+    "114181800001": {"limit_relative": 100, "max_power": 800, "limit_set_status": "Ok"},
+}
+
+
+@pytest_asyncio.fixture
+async def mock_dtu(monkeypatch):
+    """Ersetzt den gemeinsamen Client durch einen MockTransport und leert den Cache."""
+    state = {"handler": None, "requests": []}
+
+    async def dispatch(request: httpx.Request) -> httpx.Response:
+        state["requests"].append(request)
+        return await state["handler"](request)
+
+    client = httpx.AsyncClient(base_url="http://dtu.test", transport=httpx.MockTransport(dispatch))
+    monkeypatch.setattr(server, "_client", client)
+    monkeypatch.setattr(server, "_cache", {})
+    monkeypatch.setattr(server, "_cache_locks", {})
+    monkeypatch.setattr(server, "_cache_generations", {})
+    yield state
+    await client.aclose()
+
+
+def _expire(path: str) -> None:
+    server._cache[path] = (0.0, *server._cache[path][1:])
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_within_ttl(mock_dtu):
+    async def handler(request):
+        return httpx.Response(200, json=LIMIT_STATUS)
+
+    mock_dtu["handler"] = handler
+    first = await server._get("/api/limit/status", ttl=60)
+    second = await server._get("/api/limit/status", ttl=60)
+
+    assert first == second == LIMIT_STATUS
+    assert len(mock_dtu["requests"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_not_modified_reuses_cached_body(mock_dtu):
+    async def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=LIMIT_STATUS, headers={"ETag": '"v1"'})
+
+    mock_dtu["handler"] = handler
+    first = await server._get("/api/limit/status", ttl=60)
+    _expire("/api/limit/status")
+    second = await server._get("/api/limit/status", ttl=60)
+
+    assert second is first
+    assert [r.headers.get("If-None-Match") for r in mock_dtu["requests"]] == [None, '"v1"']
+    # 304 frischt den Zeitstempel auf, der nächste Aufruf kommt aus dem Cache
+    await server._get("/api/limit/status", ttl=60)
+    assert len(mock_dtu["requests"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_unchanged_digest_skips_parse(mock_dtu, monkeypatch):
+    async def handler(request):
+        return httpx.Response(200, content=orjson.dumps(LIMIT_STATUS))
+
+    mock_dtu["handler"] = handler
+    first = await server._get("/api/limit/status", ttl=60)
+    _expire("/api/limit/status")
+
+    def fail(_):
+        raise AssertionError("unveränderte Antwort wurde erneut geparst")
+
+    monkeypatch.setattr(server.orjson, "loads", fail)
+    second = await server._get("/api/limit/status", ttl=60)
+
+    assert second is first
+    assert len(mock_dtu["requests"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_request(mock_dtu):
+    async def handler(request):
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=LIMIT_STATUS)
+
+    mock_dtu["handler"] = handler
+    results = await asyncio.gather(*(server._get("/api/limit/status", ttl=60) for _ in range(5)))
+
+    assert all(r == LIMIT_STATUS for r in results)
+    assert len(mock_dtu["requests"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_fetch_does_not_store_stale_body(mock_dtu):
+    async def handler(request):
+        server._invalidate("/api/limit/status")  # Limit wurde währenddessen geändert
+        return httpx.Response(200, json=LIMIT_STATUS)
+
+    mock_dtu["handler"] = handler
+    await server._get("/api/limit/status", ttl=60)
+
+    assert "/api/limit/status" not in server._cache
+
+
+@pytest.mark.asyncio
+async def test_bulk_rows_stay_aligned(mock_dtu):
+    async def handler(request):
+        payload = orjson.loads(parse_qs(request.content.decode())["data"][0])
+        if payload["serial"] == "114181800003":
+            return httpx.Response(200, json={"type": "warning", "message": "Invalid inverter"})
+        return httpx.Response(200, json={"type": "success", "message": "ok"})
+
+    mock_dtu["handler"] = handler
+    params = server.BulkSetLimitInput(items=[
+        {"serial": "114181800001", "limit_value": 50},
+        {"serial": "114181800002", "limit_value": 150},  # relativ > 100 %
+        {"serial": "114181800003", "limit_value": 60},
+        {"serial": "114181800004", "limit_value": 300, "limit_type": 0},
+    ])
+    result = await server.opendtu_set_limits_bulk(params)
+
+    rows = [line for line in result.splitlines() if line.startswith("| `")]
+    assert [row.split("`")[1] for row in rows] == [
+        "114181800001", "114181800002", "114181800003", "114181800004",
+    ]
+    assert "✅ Gesetzt" in rows[0]
+    assert "❌ Wert muss zwischen 0 und 100" in rows[1]
+    assert "⚠️ warning – Invalid inverter" in rows[2]
+    assert "✅ Gesetzt" in rows[3]
+    # Nur gültige Einträge werden gesendet
+    assert len(mock_dtu["requests"]) == 3
+
+
+def test_bulk_rejects_duplicate_serials():
+    with pytest.raises(ValueError, match="114181800002"):
+        server.BulkSetLimitInput(items=[
+            {"serial": "114181800002", "limit_value": 50},
+            {"serial": "114181800002", "limit_value": 60},
+        ])